@@ -4,20 +4,29 @@ Grafana IRM Webhook Server
 Receives alerts from Grafana IRM and controls a smart lightbulb
 """
 
-import json
+import asyncio
+import atexit
 import logging
 import os
-import time
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict, Optional
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Coroutine, Dict, Optional, Tuple
 
-import requests
-import uvicorn
+import httpx
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+
+from .models import (
+    AlertGroup,
+    GrafanaWebhookPayload,
+    HealthResponse,
+    LedResponse,
+    LedStatusResponse,
+    WebhookResponse,
+)
 
 # Try to import GPIO libraries for Raspberry Pi support (Pi 5 uses gpiod)
 try:
@@ -31,143 +40,240 @@ except ImportError:
     Direction = None  # type: ignore
     Value = None  # type: ignore
 
+# Pin values resolved once instead of on every write
+_VAL_ON = Value.ACTIVE if GPIO_AVAILABLE else None
+_VAL_OFF = Value.INACTIVE if GPIO_AVAILABLE else None
+
+# LED blink patterns per alert severity: (on seconds, off seconds, repetitions)
+_BLINK_PATTERNS: Dict[str, Tuple[float, float, int]] = {
+    "critical": (0.1, 0.1, 5),
+    "high": (0.2, 0.2, 3),
+    "warning": (0.5, 0.5, 2),
+    "info": (1.0, 0.5, 1),
+    "low": (0.3, 0.3, 1),
+}
+_DEFAULT_BLINK_PATTERN = _BLINK_PATTERNS["warning"]
+
+# Shared default for webhooks without an alert_group, only read from
+_EMPTY_ALERT_GROUP = AlertGroup.model_construct()
+
 # Load environment variables from .env file
 load_dotenv()
 
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Server configuration, parsed once from the environment"""
+
+    lightbulb_type: str
+    gpio_pin: int
+    webhook_secret: Optional[str]
+    port: int
+    workers: int
+    debug: bool
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Load configuration from environment variables or config file"""
+    return Config(
+        lightbulb_type=os.getenv("LIGHTBULB_TYPE", "raspberry_pi"),
+        gpio_pin=int(os.getenv("GPIO_PIN", "17")),
+        webhook_secret=os.getenv("WEBHOOK_SECRET"),
+        port=int(os.getenv("PORT", "5000")),
+        # Only one process can own the GPIO line, so default to a single worker
+        workers=int(os.getenv("UVICORN_WORKERS", "1")),
+        debug=os.getenv("DEBUG", "false").lower() == "true",
+    )
+
+
+# Load configuration
+config = get_config()
+
 # Configure logging based on DEBUG environment variable
-debug_mode = os.getenv("DEBUG", "false").lower() == "true"
-log_level = logging.DEBUG if debug_mode else logging.INFO
+log_level = logging.DEBUG if config.debug else logging.INFO
 logging.basicConfig(
     level=log_level, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+logger.info("DEBUG: %s", config.debug)
+logger.info("LOG_LEVEL: %s", log_level)
+logger.info("LIGHTBULB_TYPE: %s", config.lightbulb_type)
+logger.info("GPIO_PIN: %s", config.gpio_pin)
+logger.info("WEBHOOK_SECRET: %s", config.webhook_secret)
+logger.info("PORT: %s", config.port)
+logger.info("UVICORN_WORKERS: %s", config.workers)
+
+# Shared client for outbound HTTP calls, reuses pooled connections across requests
+http_client: Optional[httpx.AsyncClient] = None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create shared resources on startup and release them on shutdown"""
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=5.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    )
+
+    # Claim the GPIO line once before serving requests, writes retry if this fails
+    if lightbulb_controller.lightbulb_type == "raspberry_pi":
+        lightbulb_controller._init_gpio()
+
+    try:
+        yield
+    finally:
+        lightbulb_controller._cancel_pattern()
+        await http_client.aclose()
+        http_client = None
+
+
 app = FastAPI(
     title="Grafana IRM Webhook Server",
     description="Receives alerts from Grafana IRM and controls a Raspberry Pi 5 LED",
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
-
-# Pydantic models for request/response validation
-class AlertGroup(BaseModel):
-    id: Optional[str] = None
-    title: Optional[str] = None
-    severity: Optional[str] = "warning"
-    status: Optional[str] = "firing"
-    created_at: Optional[str] = None
-    resolved_at: Optional[str] = None
-
-
-class AlertPayload(BaseModel):
-    message: Optional[str] = None
-    labels: Optional[Dict[str, str]] = None
-    annotations: Optional[Dict[str, str]] = None
-
-
-class GrafanaWebhookPayload(BaseModel):
-    event_type: Optional[str] = None
-    alert_group: Optional[AlertGroup] = None
-    alert_payload: Optional[AlertPayload] = None
-
-
-class HealthResponse(BaseModel):
-    status: str
-    timestamp: str
-    lightbulb_type: str
-
-
-class WebhookResponse(BaseModel):
-    status: str
-    action: Optional[str] = None
-    alert_title: Optional[str] = None
-    message: Optional[str] = None
-    timestamp: str
+# Compress larger responses only, using the fastest level to spare the Pi's CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
 
 
 class LightbulbController:
     """Controller for smart lightbulb operations"""
 
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Config):
         self.config = config
-        self.lightbulb_type = config.get("lightbulb_type", "raspberry_pi")
+        self.lightbulb_type = config.lightbulb_type
 
         # Raspberry Pi GPIO configuration
-        self.gpio_pin = config.get("gpio_pin")  # Default GPIO pin 18
+        self.gpio_pin = config.gpio_pin
         self.gpio_initialized = False
         self.gpio_request = None  # gpiod request object
-
-        # Initialize GPIO if using Raspberry Pi
-        # if self.lightbulb_type == "raspberry_pi" and GPIO_AVAILABLE:
-        #    self._init_gpio()
-
-    def turn_on(self, alert_data: Dict[str, Any]) -> bool:
-        """Turn on the LED when an alert is received"""
+        self._write = None  # gpio_request.set_value, bound once initialized
+        # Last value written to the pin, so status polls don't hit the hardware
+        self._last_value = _VAL_OFF
+        # Blink running in the background, cancelled by any explicit on/off
+        self._pattern_task: Optional[asyncio.Task] = None
+
+    async def turn_on(self) -> bool:
+        """Turn on the LED when an alert is received, stopping any blink"""
+        self._cancel_pattern()
+        return await self._set_light(True)
+
+    async def turn_off(self) -> bool:
+        """Turn off the LED when alert is resolved, stopping any blink"""
+        self._cancel_pattern()
+        return await self._set_light(False)
+
+    async def _set_light(self, state: bool) -> bool:
+        """Write the LED state, leaving any running blink alone"""
         try:
             if self.lightbulb_type == "raspberry_pi":
-                return self._control_raspberry_pi_light(True, alert_data)
+                return await self._control_raspberry_pi_light(state)
             else:
-                logger.error(f"Unsupported lightbulb type: {self.lightbulb_type}")
+                logger.error("Unsupported lightbulb type: %s", self.lightbulb_type)
                 return False
         except Exception as e:
-            logger.error(f"Error turning on LED: {e}")
+            logger.error("Error turning %s LED: %s", "on" if state else "off", e)
             return False
 
-    def turn_off(self, alert_data: Dict[str, Any]) -> bool:
-        """Turn off the LED when alert is resolved"""
+    def _start_pattern(self, pattern: Coroutine) -> None:
+        """Run a blink in the background, replacing the one already running"""
+        self._cancel_pattern()
+        self._pattern_task = asyncio.create_task(pattern)
+
+    def _cancel_pattern(self) -> None:
+        """Stop the running blink, if any
+
+        Pin writes never await, so a cancelled blink can only stop at one of its
+        sleeps and never writes after this returns.
+        """
+        if self._pattern_task is not None:
+            self._pattern_task.cancel()
+            self._pattern_task = None
+
+    def blink(self) -> None:
+        """Blink the LED in the background"""
+        self._start_pattern(self._blink())
+
+    async def _blink(self) -> bool:
+        """Blink the LED"""
         try:
-            if self.lightbulb_type == "raspberry_pi":
-                return self._control_raspberry_pi_light(False, alert_data)
-            else:
-                logger.error(f"Unsupported lightbulb type: {self.lightbulb_type}")
-                return False
+            await self._set_light(True)
+            await asyncio.sleep(1)
+            await self._set_light(False)
+            await asyncio.sleep(1)
+            await self._set_light(True)
+            await asyncio.sleep(1)
+            await self._set_light(False)
+            return True
         except Exception as e:
-            logger.error(f"Error turning off LED: {e}")
+            logger.error("Error blinking LED: %s", e)
             return False
 
-    def blink(self, alert_data: Dict[str, Any]) -> bool:
-        """Blink the LED"""
+    def blink_severity(self, severity: str) -> None:
+        """Play the severity pattern in the background
+
+        Only the latest alert's pattern plays, a new firing alert replaces the
+        running one and a resolve cancels it.
+        """
+        self._start_pattern(self._blink_pattern(severity))
+
+    async def _blink_pattern(self, severity: str) -> bool:
+        """Blink the LED in a pattern based on alert severity, then leave it on"""
+        on_time, off_time, repetitions = _BLINK_PATTERNS.get(
+            severity.lower(), _DEFAULT_BLINK_PATTERN
+        )
+
         try:
-            self.turn_on(alert_data)
-            time.sleep(1)
-            self.turn_off(alert_data)
-            time.sleep(1)
-            self.turn_on(alert_data)
-            time.sleep(1)
-            self.turn_off(alert_data)
-            return True
+            for _ in range(repetitions):
+                await self._set_light(True)
+                await asyncio.sleep(on_time)
+                await self._set_light(False)
+                await asyncio.sleep(off_time)
+
+            # Stay on until the alert resolves
+            return await self._set_light(True)
         except Exception as e:
-            logger.error(f"Error blinking LED: {e}")
+            logger.error("Error blinking LED pattern: %s", e)
             return False
-        return True
 
-    def get_status(self) -> str:
-        """Get the current status of the LED (on/off) by reading the GPIO pin"""
+    def get_status(self, force_hw: bool = False) -> str:
+        """Get the current status of the LED (on/off)
+
+        Returns the last value written to the pin, or reads the GPIO pin from
+        hardware when force_hw is set.
+        """
         try:
             if self.lightbulb_type == "raspberry_pi":
-                # If GPIO is initialized, read the actual value from hardware
                 if (
-                    self.gpio_initialized
-                    and self.gpio_request is not None
-                    and GPIO_AVAILABLE
+                    not self.gpio_initialized
+                    or self.gpio_request is None
+                    or not GPIO_AVAILABLE
                 ):
-                    try:
-                        # Read the current GPIO pin value from hardware
-                        pin_value = self.gpio_request.get_value(self.gpio_pin)
-                        return "on" if pin_value == Value.ACTIVE else "off"
-                    except Exception as e:
-                        logger.warning(f"Failed to read GPIO value: {e}")
-                        return "error"
-                else:
                     # GPIO not initialized yet, assume off
                     return "off"
+
+                if not force_hw:
+                    return "on" if self._last_value == _VAL_ON else "off"
+
+                try:
+                    # Read the current GPIO pin value from hardware
+                    pin_value = self.gpio_request.get_value(self.gpio_pin)
+                    return "on" if pin_value == _VAL_ON else "off"
+                except Exception as e:
+                    logger.warning("Failed to read GPIO value: %s", e)
+                    return "error"
             else:
-                logger.error(f"Unsupported lightbulb type: {self.lightbulb_type}")
+                logger.error("Unsupported lightbulb type: %s", self.lightbulb_type)
                 return "unknown"
         except Exception as e:
-            logger.error(f"Error getting LED status: {e}")
+            logger.error("Error getting LED status: %s", e)
             return "error"
 
     def _init_gpio(self):
@@ -179,58 +285,55 @@ class LightbulbController:
                 )
                 return False
 
-            # Create gpiod request for the GPIO pin
+            # Create gpiod request for the GPIO pin, starting with the LED off
             self.gpio_request = gpiod.request_lines(
                 "/dev/gpiochip0",
                 consumer="grafana-irm-webhook",
                 config={
                     self.gpio_pin: gpiod.LineSettings(
-                        direction=Direction.OUTPUT, output_value=Value.ACTIVE
+                        direction=Direction.OUTPUT, output_value=_VAL_OFF
                     )
                 },
             )
+            self._write = self.gpio_request.set_value
             self.gpio_initialized = True
-            logger.info(f"GPIO initialized on pin {self.gpio_pin} using gpiod")
+            self._last_value = _VAL_OFF
+            logger.info("GPIO initialized on pin %s using gpiod", self.gpio_pin)
             return True
         except Exception as e:
-            logger.error(f"Failed to initialize GPIO: {e}")
+            logger.error("Failed to initialize GPIO: %s", e)
             self.gpio_initialized = False
             return False
 
-    def _control_raspberry_pi_light(
-        self, state: bool, alert_data: Dict[str, Any]
-    ) -> bool:
-        """Control Raspberry Pi GPIO LED using gpiod"""
-        try:
-            if not GPIO_AVAILABLE:
-                logger.error("gpiod library not available")
-                return False
-
-            if not self.gpio_initialized:
-                if not self._init_gpio():
-                    return False
+    async def _control_raspberry_pi_light(self, state: bool) -> bool:
+        """Control Raspberry Pi GPIO LED using gpiod
 
-            if self.gpio_request is None:
-                logger.error("GPIO request not initialized")
-                return False
-
-            # Control the LED
-            value = Value.ACTIVE if state else Value.INACTIVE
-            self.gpio_request.set_value(self.gpio_pin, value)
+        Errors propagate to turn_on/turn_off, which log them and return False.
+        """
+        if self._write is None and not self._init_gpio():
+            return False
 
-            logger.info(
-                f"Raspberry Pi LED {'turned on' if state else 'turned off'} on pin {self.gpio_pin}"
-            )
+        # Control the LED, skipping the write when the pin is already there
+        value = _VAL_ON if state else _VAL_OFF
+        if value == self._last_value:
             return True
+        self._write(self.gpio_pin, value)
+        self._last_value = value
 
-        except Exception as e:
-            logger.error(f"Failed to control Raspberry Pi LED: {e}")
-            return False
+        logger.info(
+            "Raspberry Pi LED %s on pin %s",
+            "turned on" if state else "turned off",
+            self.gpio_pin,
+        )
+        return True
 
     def cleanup_gpio(self):
         """Clean up GPIO resources"""
         try:
-            self._control_raspberry_pi_light(False, {})
+            # Cleanup runs after the event loop has stopped, so write the pin directly
+            if self.gpio_request is not None:
+                self.gpio_request.set_value(self.gpio_pin, _VAL_OFF)
+                self._last_value = _VAL_OFF
 
             # The request object will be released when set to None
             # gpiod automatically handles cleanup when the object is deleted
@@ -238,79 +341,61 @@ class LightbulbController:
                 del self.gpio_request
 
             self.gpio_request = None
+            self._write = None
             self.gpio_initialized = False
 
             logger.info("GPIO cleaned up")
         except Exception as e:
-            logger.error(f"Error cleaning up GPIO: {e}")
-
-
-def load_config() -> Dict[str, Any]:
-    """Load configuration from environment variables or config file"""
-
-    logger.info(f"DEBUG: {debug_mode}")
-    logger.info(f"LOG_LEVEL: {log_level}")
-    logger.info(f"LIGHTBULB_TYPE: {os.getenv('LIGHTBULB_TYPE')}")
-    logger.info(f"GPIO_PIN: {os.getenv('GPIO_PIN')}")
-    logger.info(f"WEBHOOK_SECRET: {os.getenv('WEBHOOK_SECRET')}")
-    logger.info(f"PORT: {os.getenv('PORT')}")
+            logger.error("Error cleaning up GPIO: %s", e)
 
-    config = {
-        "lightbulb_type": os.getenv("LIGHTBULB_TYPE", "raspberry_pi"),
-        "gpio_pin": int(os.getenv("GPIO_PIN", "17")),
-        "webhook_secret": os.getenv("WEBHOOK_SECRET"),
-        "port": int(os.getenv("PORT", 5000)),
-        "debug": os.getenv("DEBUG", "false").lower() == "true",
-    }
 
-    return config
-
-
-# Load configuration
-config = load_config()
 lightbulb_controller = LightbulbController(config)
+atexit.register(lightbulb_controller.cleanup_gpio)
 
 if __name__ == "__main__":
-    logger.info(f"Starting Grafana IRM Webhook Server on port {config['port']}")
-    logger.info(f"Lightbulb type: {config['lightbulb_type']}")
+    # Only needed when run directly, uvicorn already loads it when serving api.app
+    import uvicorn
+
+    logger.info("Starting Grafana IRM Webhook Server on port %s", config.port)
+    logger.info("Lightbulb type: %s", config.lightbulb_type)
 
     try:
         uvicorn.run(
             "api.app:app",
             host="0.0.0.0",
-            port=config["port"],
-            reload=config["debug"],
+            port=config.port,
+            reload=config.debug,
+            workers=None if config.debug else config.workers,
+            loop="uvloop",
+            http="httptools",
             log_level="info",
         )
 
     except KeyboardInterrupt:
         pass
 
-    finally:
-        lightbulb_controller.cleanup_gpio()
-
 
 @app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return HealthResponse(
+    return HealthResponse.model_construct(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat(),
-        lightbulb_type=config["lightbulb_type"],
+        timestamp=datetime.now(timezone.utc).isoformat(),
+        lightbulb_type=config.lightbulb_type,
     )
 
 
 @app.post("/webhook/grafana-irm", response_model=WebhookResponse)
 async def grafana_irm_webhook(payload: GrafanaWebhookPayload):
     """Main webhook endpoint for Grafana IRM alerts"""
+    now_iso = datetime.now(timezone.utc).isoformat()
     try:
-        logger.info(
-            f"Received Grafana IRM webhook: {payload.model_dump_json(indent=2)}"
-        )
+        # Only pay for the JSON dump when it will actually be logged
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received Grafana IRM webhook: %s", payload.model_dump_json())
 
         # Extract alert information
-        alert_group = payload.alert_group or AlertGroup()
-        alert_payload = payload.alert_payload or AlertPayload()
+        alert_group = payload.alert_group or _EMPTY_ALERT_GROUP
 
         # Determine if this is an alert creation or resolution
         event_type = payload.event_type or ""
@@ -318,67 +403,56 @@ async def grafana_irm_webhook(payload: GrafanaWebhookPayload):
             event_type == "alert_group_resolved" or alert_group.status == "resolved"
         )
 
-        # Prepare alert data for lightbulb control
-        alert_data = {
-            "alert_group": alert_group.model_dump(),
-            "alert_payload": alert_payload.model_dump(),
-            "event_type": event_type,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
         # Control the lightbulb
         if is_resolved:
-            success = lightbulb_controller.turn_off(alert_data)
+            success = await lightbulb_controller.turn_off()
             action = "turned off"
         else:
-            success = lightbulb_controller.turn_on(alert_data)
+            success = await lightbulb_controller.turn_on()
             action = "turned on"
+            if success:
+                # Play the severity pattern in the background
+                lightbulb_controller.blink_severity(alert_group.severity or "warning")
 
         if success:
             logger.info(
-                f"Lightbulb {action} successfully for alert: {alert_group.title or 'Unknown'}"
+                "Lightbulb %s successfully for alert: %s",
+                action,
+                alert_group.title or "Unknown",
             )
-            return WebhookResponse(
+            return WebhookResponse.model_construct(
                 status="success",
                 action=action,
                 alert_title=alert_group.title or "Unknown",
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=now_iso,
             )
         else:
             logger.error(
-                f"Failed to {action} lightbulb for alert: {alert_group.title or 'Unknown'}"
+                "Failed to %s lightbulb for alert: %s",
+                action,
+                alert_group.title or "Unknown",
             )
             raise HTTPException(status_code=500, detail=f"Failed to {action} lightbulb")
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error processing webhook: {e}")
+        logger.error("Error processing webhook: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/webhook/test", response_model=WebhookResponse)
 async def test_webhook():
     """Test endpoint to verify lightbulb control"""
+    now_iso = datetime.now(timezone.utc).isoformat()
     try:
-        test_alert_data = {
-            "alert_group": {
-                "title": "Test Alert",
-                "severity": "warning",
-                "status": "firing",
-            },
-            "alert_payload": {"message": "This is a test alert"},
-            "event_type": "alert_group_created",
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-
-        success = lightbulb_controller.turn_on(test_alert_data)
+        success = await lightbulb_controller.turn_on()
 
         if success:
-            return WebhookResponse(
+            return WebhookResponse.model_construct(
                 status="success",
                 message="Test lightbulb control successful",
-                timestamp=datetime.utcnow().isoformat(),
+                timestamp=now_iso,
             )
         else:
             raise HTTPException(status_code=500, detail="Test lightbulb control failed")
@@ -386,55 +460,53 @@ async def test_webhook():
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error in test webhook: {e}")
+        logger.error("Error in test webhook: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/led/on")
-async def led_on(response_model=JSONResponse):
+@app.post("/api/led/on", response_model=LedResponse)
+async def led_on():
     """Endpoint to turn on the LED"""
     try:
-        lightbulb_controller.turn_on({})
-        logger.info(f"LED turned on")
-        return JSONResponse(content={"message": "LED turned on"}, status_code=200)
+        await lightbulb_controller.turn_on()
+        logger.info("LED turned on")
+        return LedResponse.model_construct(message="LED turned on")
     except Exception as e:
-        logger.error(f"Error in turning led on: {e}")
+        logger.error("Error in turning led on: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/led/off")
-async def led_off(response_model=JSONResponse):
+@app.post("/api/led/off", response_model=LedResponse)
+async def led_off():
     """Endpoint to turn off the LED"""
     try:
-        lightbulb_controller.turn_off({})
-        logger.info(f"LED turned off")
-        return JSONResponse(content={"message": "LED turned off"}, status_code=200)
+        await lightbulb_controller.turn_off()
+        logger.info("LED turned off")
+        return LedResponse.model_construct(message="LED turned off")
     except Exception as e:
-        logger.error(f"Error in turning led off: {e}")
+        logger.error("Error in turning led off: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/led/blink")
-async def led_blink(response_model=JSONResponse):
-    """Endpoint to blink the LED"""
+@app.post("/api/led/blink", response_model=LedResponse)
+async def led_blink():
+    """Endpoint to blink the LED, the pattern runs in the background"""
     try:
-        lightbulb_controller.blink({})
-        logger.info(f"LED blinked")
-        return JSONResponse(content={"message": "LED blinked"}, status_code=200)
+        lightbulb_controller.blink()
+        logger.info("LED blink scheduled")
+        return LedResponse.model_construct(message="LED blink scheduled")
     except Exception as e:
-        logger.error(f"Error in blinking led: {e}")
+        logger.error("Error in blinking led: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/led/status")
-async def led_status(response_model=JSONResponse):
-    """Endpoint to get the status of the LED"""
+@app.get("/api/led/status", response_model=LedStatusResponse)
+async def led_status(force_hw: bool = False):
+    """Endpoint to get the status of the LED, force_hw reads the pin from hardware"""
     try:
-        status = lightbulb_controller.get_status()
-        logger.info(f"LED status: {status}")
-        return JSONResponse(
-            content={"message": "LED status", "status": status}, status_code=200
-        )
+        status = lightbulb_controller.get_status(force_hw=force_hw)
+        logger.info("LED status: %s", status)
+        return LedStatusResponse.model_construct(message="LED status", status=status)
     except Exception as e:
-        logger.error(f"Error in getting led status: {e}")
+        logger.error("Error in getting led status: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
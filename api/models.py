@@ -0,0 +1,55 @@
+"""
+Pydantic models for the Grafana IRM Webhook Server
+Request payloads sent by Grafana IRM and the responses returned by the API
+"""
+
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+# Pydantic models for request/response validation
+# Responses are built server-side from trusted values, so handlers use
+# model_construct() to skip re-validating them
+class AlertGroup(BaseModel):
+    id: Optional[str] = None
+    title: Optional[str] = None
+    severity: Optional[str] = "warning"
+    status: Optional[str] = "firing"
+    created_at: Optional[str] = None
+    resolved_at: Optional[str] = None
+
+
+class AlertPayload(BaseModel):
+    message: Optional[str] = None
+    labels: Optional[Dict[str, str]] = None
+    annotations: Optional[Dict[str, str]] = None
+
+
+class GrafanaWebhookPayload(BaseModel):
+    event_type: Optional[str] = None
+    alert_group: Optional[AlertGroup] = None
+    alert_payload: Optional[AlertPayload] = None
+
+
+class HealthResponse(BaseModel):
+    status: str
+    timestamp: str
+    lightbulb_type: str
+
+
+class WebhookResponse(BaseModel):
+    status: str
+    action: Optional[str] = None
+    alert_title: Optional[str] = None
+    message: Optional[str] = None
+    timestamp: str
+
+
+class LedResponse(BaseModel):
+    message: str
+
+
+class LedStatusResponse(BaseModel):
+    message: str
+    status: str
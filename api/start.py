@@ -5,14 +5,13 @@ Provides an easy way to start the FastAPI server with proper configuration
 """
 
 import os
-import sys
 from pathlib import Path
 
-import uvicorn
-
 
 def main():
     """Start the FastAPI server with configuration"""
+    # Imported here so importing this module stays cheap
+    import uvicorn
 
     # Load environment variables from .env file if it exists
     env_file = Path(".env")
@@ -25,12 +24,14 @@ def main():
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "5000"))
     debug = os.getenv("DEBUG", "false").lower() == "true"
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
     log_level = "debug" if debug else "info"
 
     print(f"🚀 Starting Grafana IRM Webhook Server")
     print(f"📍 Host: {host}")
     print(f"🔌 Port: {port}")
     print(f"🐛 Debug: {debug}")
+    print(f"👷 Workers: {1 if debug else workers}")
     print(f"📊 Log Level: {log_level}")
     print(f"📚 API Docs: http://{host}:{port}/docs")
     print(f"📖 ReDoc: http://{host}:{port}/redoc")
@@ -42,6 +43,9 @@ def main():
         host=host,
         port=port,
         reload=debug,
+        workers=None if debug else workers,
+        loop="uvloop",
+        http="httptools",
         log_level=log_level,
         access_log=True,
     )
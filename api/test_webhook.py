@@ -4,53 +4,123 @@ Test script for Grafana IRM Webhook
 Simulates Grafana IRM webhook payloads for testing
 """
 
+import argparse
+import asyncio
 import json
-import time
-from datetime import datetime
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# Prefer orjson for encoding payloads, fall back to the stdlib
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj, default=datetime.isoformat).encode()
+
+
+# httpx enables the async severity sweep, otherwise fall back to threads
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
 
 # Test configuration
 WEBHOOK_URL = "http://localhost:5000/webhook/grafana-irm"
 TEST_URL = "http://localhost:5000/webhook/test"
 HEALTH_URL = "http://localhost:5000/health"
+LED_STATUS_URL = "http://localhost:5000/api/led/status"
+
+
+class NoDelayAdapter(HTTPAdapter):
+    """HTTPAdapter for talking to local servers with small requests
+
+    TCP_NODELAY sends each small POST immediately instead of letting Nagle
+    wait on the server's delayed ACK, SO_KEEPALIVE keeps idle pooled
+    connections from being dropped silently.
+    """
+
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+# Shared session so every call reuses the same keep-alive connection
+SESSION = requests.Session()
+SESSION.headers["Content-Type"] = "application/json"
+
+
+def mount_adapter(pool_maxsize=8):
+    """Mount the session's HTTP adapter, pool_maxsize should cover every worker"""
+    SESSION.mount(
+        "http://", NoDelayAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+    )
 
 
-def test_health():
+mount_adapter()
+
+
+def test_health(log=print):
     """Test health endpoint"""
-    print("Testing health endpoint...")
+    log("Testing health endpoint...")
     try:
-        response = requests.get(HEALTH_URL, timeout=5)
+        response = SESSION.get(HEALTH_URL, timeout=5)
         if response.status_code == 200:
-            print("✅ Health check passed")
-            print(f"Response: {response.json()}")
+            log("✅ Health check passed")
+            log(f"Response: {response.content.decode()}")
         else:
-            print(f"❌ Health check failed: {response.status_code}")
+            log(f"❌ Health check failed: {response.status_code}")
     except requests.exceptions.RequestException as e:
-        print(f"❌ Health check failed: {e}")
+        log(f"❌ Health check failed: {e}")
 
 
-def test_webhook():
+def test_webhook(log=print):
     """Test webhook endpoint"""
-    print("Testing LED control endpoint...")
+    log("Testing LED control endpoint...")
     try:
-        response = requests.post(TEST_URL, timeout=10)
+        response = SESSION.post(TEST_URL, timeout=10)
         if response.status_code == 200:
-            print("✅ LED control test passed")
-            print(f"Response: {response.json()}")
+            log("✅ LED control test passed")
+            log(f"Response: {response.content.decode()}")
         else:
-            print(f"❌ LED control test failed: {response.status_code}")
-            print(f"Response: {response.text}")
+            log(f"❌ LED control test failed: {response.status_code}")
+            log(f"Response: {response.text}")
     except requests.exceptions.RequestException as e:
-        print(f"❌ LED control test failed: {e}")
+        log(f"❌ LED control test failed: {e}")
 
 
-def test_grafana_alert(severity="warning", status="firing"):
-    """Test with simulated Grafana IRM alert payload"""
-    print(f"Testing Grafana IRM alert (severity: {severity}, status: {status})...")
+def test_led_off(log=print):
+    """Check that the LED reports off, e.g. after the alert has resolved"""
+    log("Testing LED status after resolution...")
+    try:
+        response = SESSION.get(LED_STATUS_URL, timeout=5)
+        if response.status_code == 200 and response.json()["status"] == "off":
+            log("✅ LED is off")
+        else:
+            log(f"❌ LED status check failed: {response.status_code}")
+            log(f"Response: {response.text}")
+    except requests.exceptions.RequestException as e:
+        log(f"❌ LED status check failed: {e}")
+
 
-    # Simulate Grafana IRM webhook payload
-    payload = {
+def build_grafana_alert(severity="warning", status="firing"):
+    """Build a simulated Grafana IRM webhook payload"""
+    # orjson serializes datetime natively, so keep the raw object
+    now = datetime.now(timezone.utc)
+    return {
         "event_type": (
             "alert_group_created" if status == "firing" else "alert_group_resolved"
         ),
@@ -59,10 +129,8 @@ def test_grafana_alert(severity="warning", status="firing"):
             "title": f"Test Alert - {severity.upper()}",
             "severity": severity,
             "status": status,
-            "created_at": datetime.utcnow().isoformat(),
-            "resolved_at": (
-                datetime.utcnow().isoformat() if status == "resolved" else None
-            ),
+            "created_at": now,
+            "resolved_at": now if status == "resolved" else None,
         },
         "alert_payload": {
             "message": f"This is a test {severity} alert",
@@ -78,51 +146,174 @@ def test_grafana_alert(severity="warning", status="firing"):
         },
     }
 
+
+@lru_cache(maxsize=32)
+def _build_payload_bytes(severity, status):
+    """Encoded alert payload, cached per (severity, status) so created_at is fixed"""
+    return _dumps(build_grafana_alert(severity, status))
+
+
+def test_grafana_alert(severity="warning", status="firing", body=None, log=print):
+    """Test with simulated Grafana IRM alert payload, reporting through log"""
+    log(f"Testing Grafana IRM alert (severity: {severity}, status: {status})...")
+
+    if body is None:
+        body = _build_payload_bytes(severity, status)
+
     try:
-        response = requests.post(
-            WEBHOOK_URL,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-            timeout=10,
+        response = SESSION.post(WEBHOOK_URL, data=body, timeout=10)
+        _report_grafana_alert(severity, response, log)
+
+    except requests.exceptions.RequestException as e:
+        log(f"❌ Grafana IRM alert test failed: {e}")
+
+
+async def test_grafana_alert_async(
+    client, severity="warning", status="firing", body=None, log=print
+):
+    """Async variant of test_grafana_alert, sending through an httpx client"""
+    log(f"Testing Grafana IRM alert (severity: {severity}, status: {status})...")
+
+    if body is None:
+        body = _build_payload_bytes(severity, status)
+
+    try:
+        response = await client.post(WEBHOOK_URL, content=body)
+        _report_grafana_alert(severity, response, log)
+
+    except httpx.HTTPError as e:
+        log(f"❌ Grafana IRM alert test failed: {e}")
+
+
+def _report_grafana_alert(severity, response, log):
+    """Report a webhook response, works for both requests and httpx"""
+    if response.status_code == 200:
+        log(f"✅ Grafana IRM alert test passed ({severity})")
+        log(f"Response: {response.content.decode()}")
+    else:
+        log(f"❌ Grafana IRM alert test failed: {response.status_code}")
+        log(f"Response: {response.text}")
+
+
+def run_severity_sweep(severities, bodies, concurrency):
+    """Send firing alerts concurrently from a thread pool, returning each output"""
+
+    def run_alert(severity, body):
+        # Buffer each alert's output so concurrent results don't interleave
+        lines = []
+        test_grafana_alert(severity, "firing", body, log=lines.append)
+        return lines
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(run_alert, severities, bodies))
+
+
+async def run_severity_sweep_async(severities, bodies, concurrency):
+    """Send firing alerts concurrently on one event loop, returning each output"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_alert(client, severity, body):
+        lines = []
+        async with semaphore:
+            await test_grafana_alert_async(
+                client, severity, "firing", body, log=lines.append
+            )
+        return lines
+
+    async with httpx.AsyncClient(
+        headers={"Content-Type": "application/json"},
+        timeout=10,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as client:
+        return await asyncio.gather(
+            *(run_alert(client, s, b) for s, b in zip(severities, bodies))
         )
 
-        if response.status_code == 200:
-            print(f"✅ Grafana IRM alert test passed ({severity})")
-            print(f"Response: {response.json()}")
-        else:
-            print(f"❌ Grafana IRM alert test failed: {response.status_code}")
-            print(f"Response: {response.text}")
 
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Grafana IRM alert test failed: {e}")
+def parse_args(argv=None):
+    """Parse command line options"""
+    parser = argparse.ArgumentParser(
+        description="Simulate Grafana IRM webhook payloads against a local server"
+    )
 
+    def positive_int(value):
+        try:
+            number = int(value)
+        except ValueError:
+            number = 0
+        if number < 1:
+            parser.error(f"expected a positive integer, got {value!r}")
+        return number
 
-def main():
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="collect all output and write it once at the end",
+    )
+    parser.add_argument(
+        "--count",
+        type=positive_int,
+        default=1,
+        help="number of times to run the severity sweep (default: 1)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=positive_int,
+        default=5,
+        help="maximum alerts in flight during the sweep (default: 5)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """Run all tests"""
-    print("🧪 Starting Grafana IRM LED Controller Tests")
-    print("=" * 50)
+    args = parse_args(argv)
+    mount_adapter(max(8, args.concurrency))
+
+    # In quiet mode, buffer output so it costs a single write instead of one per line
+    output = []
+    log = output.append if args.quiet else print
+
+    log("🧪 Starting Grafana IRM LED Controller Tests")
+    log("=" * 50)
 
     # Test health endpoint
-    test_health()
-    print()
+    test_health(log)
+    log("")
 
     # Test webhook endpoint
-    test_webhook()
-    print()
+    test_webhook(log)
+    log("")
+
+    # Test different alert severities concurrently, payloads are encoded up front
+    severities = ["critical", "high", "warning", "info", "low"] * args.count
+    bodies = [_build_payload_bytes(severity, "firing") for severity in severities]
+
+    if httpx is not None:
+        results = asyncio.run(
+            run_severity_sweep_async(severities, bodies, args.concurrency)
+        )
+    else:
+        results = run_severity_sweep(severities, bodies, args.concurrency)
+
+    for lines in results:
+        log("\n".join(lines))
+        log("")
+
+    # Test alert resolution once every alert has fired
+    test_grafana_alert("warning", "resolved", log=log)
+    log("")
 
-    # Test different alert severities
-    severities = ["critical", "high", "warning", "info", "low"]
-    for severity in severities:
-        test_grafana_alert(severity, "firing")
-        time.sleep(1)  # Small delay between tests
-        print()
+    # The resolve must also cancel the patterns the sweep left playing
+    test_led_off(log)
+    log("")
 
-    # Test alert resolution
-    test_grafana_alert("warning", "resolved")
-    print()
+    log("🏁 Tests completed!")
 
-    print("🏁 Tests completed!")
+    if args.quiet:
+        sys.stdout.write("\n".join(output) + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    with SESSION:
+        main()
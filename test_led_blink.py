@@ -8,25 +8,43 @@ import time
 import gpiod
 from gpiod.line import Direction, Value
 
+CHIP = "/dev/gpiochip0"
 LINE = 17
+PERIOD_S = 1.0  # seconds per on/off half-cycle
 
-request = gpiod.request_lines(
-    "/dev/gpiochip0",
-    consumer="blink-example",
-    config={
-        LINE: gpiod.LineSettings(direction=Direction.OUTPUT, output_value=Value.ACTIVE)
-    },
-)
-
-try:
-    while True:
-        request.set_value(LINE, Value.ACTIVE)
-        time.sleep(1)
-        request.set_value(LINE, Value.INACTIVE)
-        time.sleep(1)
-
-except KeyboardInterrupt:
-    pass
-
-finally:
-    request.set_value(LINE, Value.INACTIVE)
+
+def blink(chip, line, period, consumer="blink-example"):
+    """Blink a GPIO line until interrupted, leaving it off on exit"""
+    # Line values built once, each set_values() call is a single ioctl for all lines
+    active = {line: Value.ACTIVE}
+    inactive = {line: Value.INACTIVE}
+
+    with gpiod.request_lines(
+        chip,
+        consumer=consumer,
+        config={
+            line: gpiod.LineSettings(
+                direction=Direction.OUTPUT, output_value=Value.ACTIVE
+            )
+        },
+    ) as request:
+        try:
+            # Sleep until fixed monotonic deadlines so write time doesn't add drift
+            next_tick = time.monotonic()
+            while True:
+                request.set_values(active)
+                next_tick += period
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+                request.set_values(inactive)
+                next_tick += period
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+
+        except KeyboardInterrupt:
+            pass
+
+        finally:
+            request.set_values(inactive)
+
+
+if __name__ == "__main__":
+    blink(CHIP, LINE, PERIOD_S)
@@ -1,24 +1,14 @@
 #!/usr/bin/env python3
 """
 Test LED on Raspberry Pi 3 or 4
+Uses the same gpiod backend as the Pi 5 test, see test_led_blink.py
 """
 
-import time
+from test_led_blink import blink
 
-import RPi.GPIO as GPIO
+CHIP = "/dev/gpiochip0"
+LED_PIN = 17  # BCM numbering
+PERIOD_S = 1.0  # seconds per on/off half-cycle
 
-LED_PIN = 17
-GPIO.setwarnings(False)
-# GPIO.setmode(GPIO.BCM)
-GPIO.setmode(GPIO.BOARD)
-GPIO.setup(LED_PIN, GPIO.OUT)
-
-try:
-    while True:
-        GPIO.output(LED_PIN, GPIO.HIGH)
-        time.sleep(1)
-        GPIO.output(LED_PIN, GPIO.LOW)
-        time.sleep(1)
-
-except KeyboardInterrupt:
-    GPIO.cleanup()
+if __name__ == "__main__":
+    blink(CHIP, LED_PIN, PERIOD_S, consumer="blink-pi4")